@@ -47,6 +47,7 @@ BACKOFF_FACTOR: float = 1.5
 DISCOVERY_AFTER_CONNECTION_ERRORS = 10
 
 AVR_COMMAND_URL = "/goform/formiPhoneAppDirect.xml"
+SETUP_MENU_ON = "MNMEN ON"
 
 
 class Events(IntEnum):
@@ -79,22 +80,24 @@ DENON_STATE_MAPPING = {
     STATE_PAUSED: States.PAUSED,
 }
 
-TELNET_EVENTS = {
-    "PW",  # Power
-    "HD",  # HD radio station
-    "MS",  # surround Mode Setting
-    "MU",  # Muted
-    "MV",  # Master Volume
-    "NS",  # Preset
-    "NSE",  # Onscreen display information (mServer/iRadio)
-    "PS",  # Parameter Setting
-    "SI",  # Select Input source
-    "SS",  # ??
-    "TF",  # Tuner Frequency (?)
-    "ZM",  # Zone Main
-    "Z2",  # Zone 2
-    "Z3",  # Zone 3
-}
+TELNET_EVENTS = frozenset(
+    {
+        "PW",  # Power
+        "HD",  # HD radio station
+        "MS",  # surround Mode Setting
+        "MU",  # Muted
+        "MV",  # Master Volume
+        "NS",  # Preset
+        "NSE",  # Onscreen display information (mServer/iRadio)
+        "PS",  # Parameter Setting
+        "SI",  # Select Input source
+        "SS",  # ??
+        "TF",  # Tuner Frequency (?)
+        "ZM",  # Zone Main
+        "Z2",  # Zone 2
+        "Z3",  # Zone 3
+    }
+)
 
 _DenonDeviceT = TypeVar("_DenonDeviceT", bound="DenonDevice")
 _P = ParamSpec("_P")
@@ -118,7 +121,9 @@ def async_handle_denonlib_errors(
         available = True
         result = ucapi.StatusCodes.SERVER_ERROR
         try:
-            await func(self, *args, **kwargs)
+            # methods only return a status code to signal an error, e.g. an invalid parameter
+            if (status := await func(self, *args, **kwargs)) is not None:
+                return status
             return ucapi.StatusCodes.OK
         except AvrTimoutError:
             available = False
@@ -227,6 +232,8 @@ class DenonDevice:
         self._expected_state: States = States.UNKNOWN
         self._volume_step = device.volume_step
         self._update_lock = Lock()
+        # strong references to fire-and-forget tasks, the event loop only keeps weak references
+        self._background_tasks: set[asyncio.Task] = set()
 
         _LOG.debug("Denon AVR created: %s", device.address)
 
@@ -315,17 +322,17 @@ class DenonDevice:
         """Volume level of the media player (0..100)."""
         # Volume is sent in a format like -50.0. Minimum is -80.0,
         # maximum is 18.0
-        if self._receiver.volume is None:
+        volume = self._receiver.volume
+        if volume is None:
             return None
-        volume = min(self._receiver.volume + 80, 100)
-        volume = max(volume, 0)
-        return volume
+        return max(min(volume + 80, 100), 0)
 
     @property
     def source(self) -> str:
         """Return the current input source."""
-        if self._receiver.input_func is not None:
-            return self._receiver.input_func
+        input_func = self._receiver.input_func
+        if input_func is not None:
+            return input_func
         return ""
 
     @property
@@ -336,45 +343,51 @@ class DenonDevice:
     @property
     def sound_mode(self) -> str:
         """Return the current matched sound mode."""
-        if self._receiver.sound_mode is not None:
-            return self._receiver.sound_mode
+        sound_mode = self._receiver.sound_mode
+        if sound_mode is not None:
+            return sound_mode
         return ""
 
     @property
     def media_image_url(self) -> str:
         """Image url of current playing media."""
-        if self._receiver.input_func in self._receiver.playing_func_list:
-            if self._receiver.image_url is not None:
-                return self._receiver.image_url
+        receiver = self._receiver
+        if receiver.input_func in receiver.playing_func_list:
+            if (image_url := receiver.image_url) is not None:
+                return image_url
         return ""
 
     @property
     def media_title(self) -> str:
         """Title of current playing media."""
-        if self._receiver.input_func not in self._receiver.playing_func_list:
-            return self._receiver.input_func
-        if self._receiver.title is not None:
-            return self._receiver.title
-        if self._receiver.frequency is not None:
-            return self._receiver.frequency
+        receiver = self._receiver
+        input_func = receiver.input_func
+        if input_func not in receiver.playing_func_list:
+            return input_func
+        if (title := receiver.title) is not None:
+            return title
+        if (frequency := receiver.frequency) is not None:
+            return frequency
         return ""
 
     @property
     def media_artist(self) -> str:
         """Artist of current playing media, music track only."""
-        if self._receiver.artist is not None:
-            return self._receiver.artist
-        if self._receiver.band is not None:
-            return self._receiver.band
+        receiver = self._receiver
+        if (artist := receiver.artist) is not None:
+            return artist
+        if (band := receiver.band) is not None:
+            return band
         return ""
 
     @property
     def media_album_name(self) -> str:
         """Album name of current playing media, music track only."""
-        if self._receiver.album is not None:
-            return self._receiver.album
-        if self._receiver.station is not None:
-            return self._receiver.station
+        receiver = self._receiver
+        if (album := receiver.album) is not None:
+            return album
+        if (station := receiver.station) is not None:
+            return station
         return ""
 
     async def connect(self):
@@ -581,29 +594,30 @@ class DenonDevice:
             return
         # *** End logic from HA
 
-        if event == "PW":  # Power
-            if parameter == "ON":
-                self._set_expected_state(States.ON)
-            elif parameter in ("STANDBY", "OFF"):
-                self._set_expected_state(States.OFF)
-        elif event == "MV":  # Master Volume
+        # Events are checked in order of their frequency, see example event sequence below
+        if event == "PS":  # Parameter Setting
+            return  # reduce number of updates. TODO check if we need to handle certain parameters, likely Audyssey
+        if event == "MV":  # Master Volume
             self._set_expected_state(States.ON)
             level = self.volume_level
             if level is None:
                 level = int(parameter)
             self.events.emit(Events.UPDATE, self.id, {MediaAttr.VOLUME: level})
-        elif event == "MU":  # Muted
-            self._set_expected_state(States.ON)
-            muted = parameter == "ON"
-            self.events.emit(Events.UPDATE, self.id, {MediaAttr.MUTED: muted})
         elif event == "SI":  # Select Input source
             self._set_expected_state(States.ON)
             self.events.emit(Events.UPDATE, self.id, {MediaAttr.SOURCE: self._receiver.input_func})
         elif event == "MS":  # surround Mode Setting
             self._set_expected_state(States.ON)
             self.events.emit(Events.UPDATE, self.id, {MediaAttr.SOUND_MODE: self._receiver.sound_mode})
-        elif event == "PS":  # Parameter Setting
-            return  # reduce number of updates. TODO check if we need to handle certain parameters, likely Audyssey
+        elif event == "MU":  # Muted
+            self._set_expected_state(States.ON)
+            muted = parameter == "ON"
+            self.events.emit(Events.UPDATE, self.id, {MediaAttr.MUTED: muted})
+        elif event == "PW":  # Power
+            if parameter == "ON":
+                self._set_expected_state(States.ON)
+            elif parameter in ("STANDBY", "OFF"):
+                self._set_expected_state(States.OFF)
 
         self._notify_updated_data()
 
@@ -652,27 +666,25 @@ class DenonDevice:
         if not self._use_telnet:
             self._set_expected_state(States.OFF)
 
-    @async_handle_denonlib_errors
-    async def power_toggle(self) -> ucapi.StatusCodes:
+    def power_toggle(self) -> Awaitable[ucapi.StatusCodes]:
         """Send power-on or -off command to AVR based on current power state."""
-        if self._receiver.power is not None and self._receiver.power == "ON":
-            await self.power_off()
-        await self.power_on()
+        if self._receiver.power == "ON":
+            return self.power_off()
+        return self.power_on()
 
     @async_handle_denonlib_errors
     async def set_volume_level(self, volume: float | None) -> ucapi.StatusCodes:
         """Set volume level, range 0..100."""
         if volume is None:
             return ucapi.StatusCodes.BAD_REQUEST
+        volume = max(min(volume, 100), 0)
         # Volume has to be sent in a format like -50.0. Minimum is -80.0,
         # maximum is 18.0
-        volume_denon = float(volume - 80)
-        if volume_denon > 18:
-            volume_denon = float(18)
+        volume_denon = float(min(volume - 80, 18))
         await self._receiver.async_set_volume(volume_denon)
         self.events.emit(Events.UPDATE, self.id, {MediaAttr.VOLUME: volume})
         if self._use_telnet and not self._update_lock.locked():
-            await self._event_loop.create_task(self.async_update_receiver_data())
+            self._create_background_task(self.async_update_receiver_data())
         else:
             self._expected_volume = volume
 
@@ -739,55 +751,55 @@ class DenonDevice:
             return ucapi.StatusCodes.BAD_REQUEST
         await self._receiver.async_set_sound_mode(sound_mode)
 
-    async def cursor_up(self) -> ucapi.StatusCodes:
+    def cursor_up(self) -> Awaitable[ucapi.StatusCodes]:
         """Send cursor up command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNCUP")
+        return self.send_command("MNCUP")
 
-    async def cursor_down(self) -> ucapi.StatusCodes:
+    def cursor_down(self) -> Awaitable[ucapi.StatusCodes]:
         """Send cursor down command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNCDN")
+        return self.send_command("MNCDN")
 
-    async def cursor_left(self) -> ucapi.StatusCodes:
+    def cursor_left(self) -> Awaitable[ucapi.StatusCodes]:
         """Send cursor left command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNCLT")
+        return self.send_command("MNCLT")
 
-    async def cursor_right(self) -> ucapi.StatusCodes:
+    def cursor_right(self) -> Awaitable[ucapi.StatusCodes]:
         """Send cursor right command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNCRT")
+        return self.send_command("MNCRT")
 
-    async def cursor_enter(self) -> ucapi.StatusCodes:
+    def cursor_enter(self) -> Awaitable[ucapi.StatusCodes]:
         """Send cursor enter command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNENT")
+        return self.send_command("MNENT")
 
-    async def info(self) -> ucapi.StatusCodes:
+    def info(self) -> Awaitable[ucapi.StatusCodes]:
         """Send info OSD command command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNINF")
+        return self.send_command("MNINF")
 
-    async def options(self) -> ucapi.StatusCodes:
+    def options(self) -> Awaitable[ucapi.StatusCodes]:
         """Send options menu command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNOPT")
+        return self.send_command("MNOPT")
 
-    async def back(self) -> ucapi.StatusCodes:
+    def back(self) -> Awaitable[ucapi.StatusCodes]:
         """Send back command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNRTN")
+        return self.send_command("MNRTN")
 
-    async def setup_open(self) -> ucapi.StatusCodes:
+    def setup_open(self) -> Awaitable[ucapi.StatusCodes]:
         """Send open setup menu command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNMEN ON")
+        return self.send_command(SETUP_MENU_ON)
 
-    async def setup_close(self) -> ucapi.StatusCodes:
+    def setup_close(self) -> Awaitable[ucapi.StatusCodes]:
         """Send close menu command to AVR."""
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
-        return await self.send_command("MNMEN OFF")
+        return self.send_command("MNMEN OFF")
 
     @async_handle_denonlib_errors
     async def setup(self) -> ucapi.StatusCodes:
@@ -795,7 +807,7 @@ class DenonDevice:
         # TODO : to be updated when PR will be released https://github.com/ol-iver/denonavr/pull/290
         # Using http get as the telnet commands won't return any values
         res = await self._receiver.async_get_command(AVR_COMMAND_URL + "?MNMEN?")
-        if res is not None and res == "MNMEN ON":
+        if res == SETUP_MENU_ON:
             await self.setup_close()
         else:
             await self.setup_open()
@@ -809,6 +821,12 @@ class DenonDevice:
             url = AVR_COMMAND_URL + "?" + cmd.replace(" ", "%20")
             await self._receiver.async_get_command(url)
 
+    def _create_background_task(self, coro: Coroutine) -> None:
+        """Run the given coroutine in a background task without waiting for the result."""
+        task = self._event_loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _increase_expected_volume(self):
         """Without telnet, increase expected volume and send update event."""
         if not self._use_telnet or self._expected_volume is None:
@@ -816,7 +834,7 @@ class DenonDevice:
         self._expected_volume = min(self._expected_volume + self._volume_step, 100)
         # Send updated volume if no update task in progress
         if not self._update_lock.locked():
-            self._event_loop.create_task(self._receiver.async_update())
+            self._create_background_task(self._receiver.async_update())
 
     def _decrease_expected_volume(self):
         """Without telnet, decrease expected volume and send update event."""
@@ -825,4 +843,4 @@ class DenonDevice:
         self._expected_volume = max(self._expected_volume - self._volume_step, 0)
         # Send updated volume if no update task in progress
         if not self._update_lock.locked():
-            self._event_loop.create_task(self._receiver.async_update())
+            self._create_background_task(self._receiver.async_update())
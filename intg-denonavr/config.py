@@ -26,14 +26,15 @@ def create_entity_id(avr_id: str, entity_type: EntityTypes) -> str:
 
 def avr_from_entity_id(entity_id: str) -> str | None:
     """
-    Return the avr_id prefix of an entity_id.
+    Return the avr_id of an entity_id.
 
-    The prefix is the part before the first dot in the name and refers to the AVR device identifier.
+    The avr_id is the part after the first dot in the name and refers to the AVR device identifier.
 
     :param entity_id: the entity identifier
-    :return: the device prefix, or None if entity_id doesn't contain a dot
+    :return: the device identifier, or None if entity_id doesn't contain a dot
     """
-    return entity_id.split(".", 1)[1]
+    _, sep, avr_id = entity_id.partition(".")
+    return avr_id if sep else None
 
 
 @dataclass
@@ -36,11 +36,10 @@ async def receiver_status_poller(interval: float = 10.0) -> None:
         if _R2_IN_STANDBY:
             continue
         try:
-            for receiver in _configured_avrs.values():
-                if not receiver.active:
-                    continue
-                # TODO #20  run in parallel, join, adjust interval duration based on execution time for next update
-                await receiver.async_update_receiver_data()
+            # TODO #20 adjust interval duration based on execution time for next update
+            await asyncio.gather(
+                *(receiver.async_update_receiver_data() for receiver in _configured_avrs.values() if receiver.active)
+            )
         except (KeyError, ValueError):  # TODO check parallel access / modification while iterating a dict
             pass
 
@@ -74,8 +73,7 @@ async def on_r2_enter_standby() -> None:
 
     _R2_IN_STANDBY = True
     _LOG.debug("Enter standby event: disconnecting device(s)")
-    for configured in _configured_avrs.values():
-        await configured.disconnect()
+    await asyncio.gather(*(configured.disconnect() for configured in _configured_avrs.values()))
 
 
 @api.listens_to(ucapi.Events.EXIT_STANDBY)
@@ -112,6 +110,9 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
             receiver = _configured_avrs[avr_id]
             state = media_player.state_from_avr(receiver.state)
             api.configured_entities.update_attributes(entity_id, {ucapi.media_player.Attributes.STATE: state})
+            # the receiver is disconnected if its entity was unsubscribed before
+            if not receiver.active:
+                _LOOP.create_task(receiver.connect())
             continue
 
         device = config.devices.get(avr_id)
@@ -123,21 +124,27 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
 
 @api.listens_to(ucapi.Events.UNSUBSCRIBE_ENTITIES)
 async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
-    """On unsubscribe, we disconnect the objects and remove listeners for events."""
+    """On unsubscribe, we disconnect the objects. Event listeners are kept for a later subscription."""
     _LOG.debug("Unsubscribe entities event: %s", entity_ids)
     for entity_id in entity_ids:
         avr_id = avr_from_entity_id(entity_id)
         if avr_id is None:
             continue
-        if avr_id in _configured_avrs:
+        if configured := _configured_avrs.get(avr_id):
             # TODO #21 this doesn't work once we have more than one entity per device!
             # --- START HACK ---
             # Since an AVR instance only provides exactly one media-player, it's save to disconnect if the entity is
             # unsubscribed. This should be changed to a more generic logic, also as template for other integrations!
             # Otherwise this sets a bad copy-paste example and leads to more issues in the future.
             # --> correct logic: check configured_entities, if empty: disconnect
-            await _configured_avrs[entity_id].disconnect()
-            _configured_avrs[entity_id].events.remove_all_listeners()
+
+            # The entity is gone: don't handle the disconnect event, it would set the device state to disconnected
+            # even if other receivers are still connected.
+            configured.events.remove_listener(avr.Events.DISCONNECTED, on_avr_disconnected)
+            try:
+                await configured.disconnect()
+            finally:
+                configured.events.on(avr.Events.DISCONNECTED, on_avr_disconnected)
 
 
 async def on_avr_connected(avr_id: str):
@@ -6,7 +6,8 @@ Media-player entity functions.
 """
 
 import logging
-from typing import Any
+from functools import partial
+from typing import Any, Awaitable, Callable
 
 import avr
 from config import AvrDevice, create_entity_id
@@ -32,6 +33,54 @@ MEDIA_PLAYER_STATE_MAPPING = {
     avr.States.UNKNOWN: States.UNKNOWN,
 }
 
+# Entity attributes taken over as-is from an AVR update if changed
+_UPDATE_ATTRIBUTES = (
+    Attributes.MEDIA_ARTIST,
+    Attributes.MEDIA_ALBUM,
+    Attributes.MEDIA_IMAGE_URL,
+    Attributes.MEDIA_TITLE,
+    Attributes.MUTED,
+    Attributes.SOURCE,
+    Attributes.VOLUME,
+)
+
+# Channel level commands: command prefix and AVR channel code of the CV (channel volume) command
+_CHANNEL_LEVELS = (
+    ("FRONT_LEFT", "FL"),
+    ("FRONT_RIGHT", "FR"),
+    ("CENTER", "C"),
+    ("SUB1", "SW"),
+    ("SUB2", "SW2"),
+    ("SUB3", "SW3"),
+    ("SUB4", "SW4"),
+    ("SURROUND_LEFT", "SL"),
+    ("SURROUND_RIGHT", "SR"),
+    ("SURROUND_BACK_LEFT", "SBL"),
+    ("SURROUND_BACK_RIGHT", "SBR"),
+    ("FRONT_HEIGHT_LEFT", "FHL"),
+    ("FRONT_HEIGHT_RIGHT", "FHR"),
+    ("FRONT_WIDE_LEFT", "FWL"),
+    ("FRONT_WIDE_RIGHT", "FWR"),
+    ("TOP_FRONT_LEFT", "TFL"),
+    ("TOP_FRONT_RIGHT", "TFR"),
+    ("TOP_MIDDLE_LEFT", "TML"),
+    ("TOP_MIDDLE_RIGHT", "TMR"),
+    ("TOP_REAR_LEFT", "TRL"),
+    ("TOP_REAR_RIGHT", "TRR"),
+    ("REAR_HEIGHT_LEFT", "RHL"),
+    ("REAR_HEIGHT_RIGHT", "RHR"),
+    ("FRONT_DOLBY_LEFT", "FDL"),
+    ("FRONT_DOLBY_RIGHT", "FDR"),
+    ("SURROUND_DOLBY_LEFT", "SDL"),
+    ("SURROUND_DOLBY_RIGHT", "SDR"),
+    ("BACK_DOLBY_LEFT", "BDL"),
+    ("BACK_DOLBY_RIGHT", "BDR"),
+    ("SURROUND_HEIGHT_LEFT", "SHL"),
+    ("SURROUND_HEIGHT_RIGHT", "SHR"),
+    ("TOP_SURROUND", "TS"),
+    ("CENTER_HEIGHT", "CH"),
+)
+
 
 SimpleCommandMappings = {
     "OUTPUT_1": "VSMONI1",
@@ -46,72 +95,11 @@ SimpleCommandMappings = {
     "TRIGGER1_OFF": "TR1 OFF",
     "TRIGGER2_ON": "TR2 ON",
     "TRIGGER2_OFF": "TR2 OFF",
-    "FRONT_LEFT_UP": "CVFL UP",
-    "FRONT_LEFT_DOWN": "CVFL DOWN",
-    "FRONT_RIGHT_UP": "CVFR UP",
-    "FRONT_RIGHT_DOWN": "CVFR DOWN",
-    "CENTER_UP": "CVC UP",
-    "CENTER_DOWN": "CVC DOWN",
-    "SUB1_UP": "CVSW UP",
-    "SUB1_DOWN": "CVSW DOWN",
-    "SUB2_UP": "CVSW2 UP",
-    "SUB2_DOWN": "CVSW2 DOWN",
-    "SUB3_UP": "CVSW3 UP",
-    "SUB3_DOWN": "CVSW3 DOWN",
-    "SUB4_UP": "CVSW4 UP",
-    "SUB4_DOWN": "CVSW4 DOWN",
-    "SURROUND_LEFT_UP": "CVSL UP",
-    "SURROUND_LEFT_DOWN": "CVSL DOWN",
-    "SURROUND_RIGHT_UP": "CVSR UP",
-    "SURROUND_RIGHT_DOWN": "CVSR DOWN",
-    "SURROUND_BACK_LEFT_UP": "CVSBL UP",
-    "SURROUND_BACK_LEFT_DOWN": "CVSBL DOWN",
-    "SURROUND_BACK_RIGHT_UP": "CVSBR UP",
-    "SURROUND_BACK_RIGHT_DOWN": "CVSBR DOWN",
-    "FRONT_HEIGHT_LEFT_UP": "CVFHL UP",
-    "FRONT_HEIGHT_LEFT_DOWN": "CVFHL DOWN",
-    "FRONT_HEIGHT_RIGHT_UP": "CVFHR UP",
-    "FRONT_HEIGHT_RIGHT_DOWN": "CVFHR DOWN",
-    "FRONT_WIDE_LEFT_UP": "CVFWL UP",
-    "FRONT_WIDE_LEFT_DOWN": "CVFWL DOWN",
-    "FRONT_WIDE_RIGHT_UP": "CVFWR UP",
-    "FRONT_WIDE_RIGHT_DOWN": "CVFWR DOWN",
-    "TOP_FRONT_LEFT_UP": "CVTFL UP",
-    "TOP_FRONT_LEFT_DOWN": "CVTFL DOWN",
-    "TOP_FRONT_RIGHT_UP": "CVTFR UP",
-    "TOP_FRONT_RIGHT_DOWN": "CVTFR DOWN",
-    "TOP_MIDDLE_LEFT_UP": "CVTML UP",
-    "TOP_MIDDLE_LEFT_DOWN": "CVTML DOWN",
-    "TOP_MIDDLE_RIGHT_UP": "CVTMR UP",
-    "TOP_MIDDLE_RIGHT_DOWN": "CVTMR DOWN",
-    "TOP_REAR_LEFT_UP": "CVTRL UP",
-    "TOP_REAR_LEFT_DOWN": "CVTRL DOWN",
-    "TOP_REAR_RIGHT_UP": "CVTRR UP",
-    "TOP_REAR_RIGHT_DOWN": "CVTRR DOWN",
-    "REAR_HEIGHT_LEFT_UP": "CVRHL UP",
-    "REAR_HEIGHT_LEFT_DOWN": "CVRHL DOWN",
-    "REAR_HEIGHT_RIGHT_UP": "CVRHR UP",
-    "REAR_HEIGHT_RIGHT_DOWN": "CVRHR DOWN",
-    "FRONT_DOLBY_LEFT_UP": "CVFDL UP",
-    "FRONT_DOLBY_LEFT_DOWN": "CVFDL DOWN",
-    "FRONT_DOLBY_RIGHT_UP": "CVFDR UP",
-    "FRONT_DOLBY_RIGHT_DOWN": "CVFDR DOWN",
-    "SURROUND_DOLBY_LEFT_UP": "CVSDL UP",
-    "SURROUND_DOLBY_LEFT_DOWN": "CVSDL DOWN",
-    "SURROUND_DOLBY_RIGHT_UP": "CVSDR UP",
-    "SURROUND_DOLBY_RIGHT_DOWN": "CVSDR DOWN",
-    "BACK_DOLBY_LEFT_UP": "CVBDL UP",
-    "BACK_DOLBY_LEFT_DOWN": "CVBDL DOWN",
-    "BACK_DOLBY_RIGHT_UP": "CVBDR UP",
-    "BACK_DOLBY_RIGHT_DOWN": "CVBDR DOWN",
-    "SURROUND_HEIGHT_LEFT_UP": "CVSHL UP",
-    "SURROUND_HEIGHT_LEFT_DOWN": "CVSHL DOWN",
-    "SURROUND_HEIGHT_RIGHT_UP": "CVSHR UP",
-    "SURROUND_HEIGHT_RIGHT_DOWN": "CVSHR DOWN",
-    "TOP_SURROUND_UP": "CVTS UP",
-    "TOP_SURROUND_DOWN": "CVTS DOWN",
-    "CENTER_HEIGHT_UP": "CVCH UP",
-    "CENTER_HEIGHT_DOWN": "CVCH DOWN",
+    **{
+        f"{name}_{direction}": f"CV{channel} {direction}"
+        for name, channel in _CHANNEL_LEVELS
+        for direction in ("UP", "DOWN")
+    },
     "DELAY_UP": "PSDELAY UP",
     "DELAY_DOWN": "PSDELAY DOWN",
     "SURROUND_MODE_AUTO": "MSAUTO",
@@ -125,7 +113,7 @@ SimpleCommandMappings = {
     "SURROUND_MODE_NEXT": "MSLEFT",
     "SURROUND_MODE_PREVIOUS": "MSRIGHT",
     "MULTIEQ_REFERENCE": "PSMULTEQ:AUDYSSEY",
-    "MULTIEQ_BYPASS_LR": "MULTEQ:BYP.LR",
+    "MULTIEQ_BYPASS_LR": "PSMULTEQ:BYP.LR",
     "MULTIEQ_FLAT": "PSMULTEQ:FLAT",
     "MULTIEQ_OFF": "PSMULTEQ:OFF",
     "DYNAMIC_EQ_ON": "PSDYNEQ ON",
@@ -146,6 +134,34 @@ SimpleCommandMappingsDenon = {
     "STATUS": "RCSHP0230030",
 }
 
+# Simple command options of the media-player entity, shared by all entities of the same receiver brand
+_SIMPLE_COMMANDS = tuple(SimpleCommandMappings)
+_SIMPLE_COMMANDS_DENON = tuple(SimpleCommandMappingsDenon)
+
+# Entity commands without parameters, mapped to the DenonDevice method handling them
+_COMMAND_METHODS = {
+    Commands.PLAY_PAUSE: "play_pause",
+    Commands.NEXT: "next",
+    Commands.PREVIOUS: "previous",
+    Commands.VOLUME_UP: "volume_up",
+    Commands.VOLUME_DOWN: "volume_down",
+    Commands.ON: "power_on",
+    Commands.OFF: "power_off",
+    Commands.TOGGLE: "power_toggle",
+    Commands.CURSOR_UP: "cursor_up",
+    Commands.CURSOR_DOWN: "cursor_down",
+    Commands.CURSOR_LEFT: "cursor_left",
+    Commands.CURSOR_RIGHT: "cursor_right",
+    Commands.CURSOR_ENTER: "cursor_enter",
+    Commands.BACK: "back",
+    Commands.MENU: "setup",
+    Commands.CONTEXT_MENU: "options",
+    Commands.INFO: "info",
+}
+
+# simple command handlers are looked up before any entity command is handled: a simple command must never shadow one
+assert SimpleCommandMappingsDenon.keys().isdisjoint(Commands)
+
 
 class DenonMediaPlayer(MediaPlayer):
     """Representation of a Denon Media Player entity."""
@@ -153,6 +169,21 @@ class DenonMediaPlayer(MediaPlayer):
     def __init__(self, device: AvrDevice, receiver: avr.DenonDevice):
         """Initialize the class."""
         self._receiver: avr.DenonDevice = receiver
+        # Denon has additional simple commands
+        if "denon" in device.name.lower():
+            simple_command_mappings = SimpleCommandMappingsDenon
+            self.simple_commands = _SIMPLE_COMMANDS_DENON
+        else:
+            simple_command_mappings = SimpleCommandMappings
+            self.simple_commands = _SIMPLE_COMMANDS
+        # the receiver instance is fixed for the lifetime of the entity: bind the command handlers once.
+        # Only the simple commands supported by this receiver are bound, all others are not implemented.
+        self._command_handlers: dict[str, Callable[[], Awaitable[StatusCodes]]] = {
+            cmd: getattr(receiver, method) for cmd, method in _COMMAND_METHODS.items()
+        }
+        self._command_handlers.update(
+            (cmd, partial(receiver.send_command, avr_cmd)) for cmd, avr_cmd in simple_command_mappings.items()
+        )
 
         entity_id = create_entity_id(receiver.id, EntityTypes.MEDIA_PLAYER)
         features = [
@@ -192,12 +223,6 @@ class DenonMediaPlayer(MediaPlayer):
             attributes[Attributes.SOUND_MODE] = ""
             attributes[Attributes.SOUND_MODE_LIST] = []
 
-        # Denon has additional simple commands
-        if "denon" in device.name.lower():
-            self.simple_commands = [*SimpleCommandMappingsDenon]
-        else:
-            self.simple_commands = [*SimpleCommandMappings]
-
         options = {Options.SIMPLE_COMMANDS: self.simple_commands}
 
         super().__init__(
@@ -225,52 +250,23 @@ class DenonMediaPlayer(MediaPlayer):
             _LOG.warning("No AVR instance for entity: %s", self.id)
             return StatusCodes.SERVICE_UNAVAILABLE
 
+        # parameterless entity commands and simple commands are resolved with a single lookup
+        if cmd_id in self._command_handlers:
+            return await self._command_handlers[cmd_id]()
+
+        if params is None:
+            params = {}
+
         match cmd_id:
-            case Commands.PLAY_PAUSE:
-                res = await self._receiver.play_pause()
-            case Commands.NEXT:
-                res = await self._receiver.next()
-            case Commands.PREVIOUS:
-                res = await self._receiver.previous()
             case Commands.VOLUME:
                 res = await self._receiver.set_volume_level(params.get("volume"))
-            case Commands.VOLUME_UP:
-                res = await self._receiver.volume_up()
-            case Commands.VOLUME_DOWN:
-                res = await self._receiver.volume_down()
             case Commands.MUTE_TOGGLE:
                 res = await self._receiver.mute(not self.attributes[Attributes.MUTED])
-            case Commands.ON:
-                res = await self._receiver.power_on()
-            case Commands.OFF:
-                res = await self._receiver.power_off()
-            case Commands.TOGGLE:
-                res = await self._receiver.power_toggle()
             case Commands.SELECT_SOURCE:
                 res = await self._receiver.select_source(params.get("source"))
-            case Commands.SELECT_SOUND_MODE:
+            # sound mode support is configured per device: don't send the command to a receiver without it
+            case Commands.SELECT_SOUND_MODE if Features.SELECT_SOUND_MODE in self.features:
                 res = await self._receiver.select_sound_mode(params.get("mode"))
-            case Commands.CURSOR_UP:
-                res = await self._receiver.cursor_up()
-            case Commands.CURSOR_DOWN:
-                res = await self._receiver.cursor_down()
-            case Commands.CURSOR_LEFT:
-                res = await self._receiver.cursor_left()
-            case Commands.CURSOR_RIGHT:
-                res = await self._receiver.cursor_right()
-            case Commands.CURSOR_ENTER:
-                res = await self._receiver.cursor_enter()
-            case Commands.BACK:
-                res = await self._receiver.back()
-            case Commands.MENU:
-                res = await self._receiver.setup()
-            case Commands.CONTEXT_MENU:
-                res = await self._receiver.options()
-            case Commands.INFO:
-                res = await self._receiver.info()
-            # Use SimpleCommandMappingsDenon as it covers both the shared and Denon specific commands
-            case cmd if cmd in SimpleCommandMappingsDenon:
-                res = await self._receiver.send_command(SimpleCommandMappingsDenon[cmd])
             case _:
                 return StatusCodes.NOT_IMPLEMENTED
 
@@ -287,19 +283,11 @@ class DenonMediaPlayer(MediaPlayer):
 
         if Attributes.STATE in update:
             state = state_from_avr(update[Attributes.STATE])
-            attributes = self._key_update_helper(Attributes.STATE, state, attributes)
-
-        for attr in [
-            Attributes.MEDIA_ARTIST,
-            Attributes.MEDIA_ALBUM,
-            Attributes.MEDIA_IMAGE_URL,
-            Attributes.MEDIA_TITLE,
-            Attributes.MUTED,
-            Attributes.SOURCE,
-            Attributes.VOLUME,
-        ]:
+            self._key_update_helper(Attributes.STATE, state, attributes)
+
+        for attr in _UPDATE_ATTRIBUTES:
             if attr in update:
-                attributes = self._key_update_helper(attr, update[attr], attributes)
+                self._key_update_helper(attr, update[attr], attributes)
 
         if Attributes.SOURCE_LIST in update:
             if Attributes.SOURCE_LIST in self.attributes:
@@ -308,7 +296,7 @@ class DenonMediaPlayer(MediaPlayer):
 
         if Features.SELECT_SOUND_MODE in self.features:
             if Attributes.SOUND_MODE in update:
-                attributes = self._key_update_helper(Attributes.SOUND_MODE, update[Attributes.SOUND_MODE], attributes)
+                self._key_update_helper(Attributes.SOUND_MODE, update[Attributes.SOUND_MODE], attributes)
             if Attributes.SOUND_MODE_LIST in update:
                 if Attributes.SOUND_MODE_LIST in self.attributes:
                     if update[Attributes.SOUND_MODE_LIST] != self.attributes[Attributes.SOUND_MODE_LIST]:
@@ -325,18 +313,11 @@ class DenonMediaPlayer(MediaPlayer):
 
         return attributes
 
-    def _key_update_helper(self, key: str, value: str | None, attributes):
-        if value is None:
-            return attributes
-
-        if key in self.attributes:
-            if self.attributes[key] != value:
-                attributes[key] = value
-        else:
+    def _key_update_helper(self, key: str, value: str | None, attributes: dict[str, Any]) -> None:
+        # a missing entity attribute reads as None, which never equals a set value
+        if value is not None and self.attributes.get(key) != value:
             attributes[key] = value
 
-        return attributes
-
 
 def state_from_avr(avr_state: avr.States) -> States:
     """